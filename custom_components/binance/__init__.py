@@ -16,18 +16,34 @@ hass.data[DOMAIN] layout:
         "price_coordinator": BinancePriceCoordinator,
         "ws_manager": BinanceWebSocketManager | None,
         "pair_registry": {entry_id: {"futures": [...], "spot": [...]}, ...},
+        "merged_futures": set[str],   # union across entries (refcounted)
+        "merged_spot": set[str],
+        "pair_counts": {"futures": Counter, "spot": Counter},
+        "all_price_uids": set[str],   # price sensor unique IDs, ditto
         "use_websocket": bool,
+        "api_sem": asyncio.Semaphore,
+        "account_coordinators": {key_id: {"coordinator": ..., "refs": int}},
     }
     entry_id: {
         "account_coordinator": BinanceAccountCoordinator,
+        "account_key_id": str,
     }
+
+Account coordinators are shared between entries configured with the same
+API key (keyed by a hash of the key, never the key itself), so duplicate
+entries don't double the signed-request rate.
 """
 
 import asyncio
 import hashlib
 import hmac
 import logging
+import random
+import sys
 import time
+from collections import Counter
+from contextlib import nullcontext
+from dataclasses import dataclass
 from datetime import timedelta
 from http import HTTPStatus
 
@@ -52,18 +68,36 @@ from .const import (
     FUTURES_API_URL,
     FUTURES_DATA,
     PNL_DATA,
+    PNL_TOTAL,
     PLATFORMS,
     RATE_LIMIT_BACKOFF_BASE,
     RATE_LIMIT_BACKOFF_MAX,
+    REST_CONCURRENCY_LIMIT,
     SHARED_KEY,
     SPOT_API_URL,
     SPOT_DATA,
     WALLET_DATA,
+    WS_FLUSH_INTERVAL,
 )
-from .websocket import BinanceWebSocketManager
+from .websocket import BinanceWebSocketManager, Ticker
+
+try:
+    # HA core ships orjson; 3-10x faster than stdlib on the big ticker arrays.
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
+# Zero formats positionRisk uses for flat positions; matching the string
+# skips the float() parse for the vast majority of entries.
+_ZERO_AMTS = frozenset(("0", "0.0", "0.00", "0.000", "0.0000"))
+
+# Per-request timeout. Timing out individual requests lets the others in
+# a gather() finish instead of an outer asyncio.timeout cancelling them
+# mid-flight and racing aiohttp's connection cleanup.
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=15)
+
 
 # ======================================================================
 # Helpers
@@ -78,48 +112,165 @@ def _get_entry_pairs(entry: ConfigEntry) -> tuple[list[str], list[str]]:
     spot = entry.options.get(
         CONF_SPOT_PAIRS, entry.data.get(CONF_SPOT_PAIRS, [])
     )
-    return list(futures), list(spot)
+    # Config flow already stores lists; only copy unusual shapes.
+    if not isinstance(futures, list):
+        futures = list(futures)
+    if not isinstance(spot, list):
+        spot = list(spot)
+    return futures, spot
 
 
 def _merged_pairs(shared: dict) -> tuple[list[str], list[str]]:
-    """Compute the union of all entries' pair lists."""
-    all_futures: set[str] = set()
-    all_spot: set[str] = set()
-    for pairs in shared["pair_registry"].values():
-        all_futures.update(pairs.get("futures", []))
-        all_spot.update(pairs.get("spot", []))
-    return sorted(all_futures), sorted(all_spot)
+    """Return the union of all entries' pair lists.
+
+    The union sets are maintained incrementally by _register_pairs /
+    _unregister_pairs, so this never rescans the registry.
+    """
+    return sorted(shared["merged_futures"]), sorted(shared["merged_spot"])
+
+
+def _register_pairs(
+    shared: dict, entry_id: str, futures_pairs: list[str], spot_pairs: list[str]
+) -> None:
+    """Register an entry's pairs, updating the merged sets in place."""
+    if entry_id in shared["pair_registry"]:
+        # Entry reload — drop the old pairs before counting the new ones.
+        _unregister_pairs(shared, entry_id)
+
+    shared["pair_registry"][entry_id] = {
+        "futures": futures_pairs,
+        "spot": spot_pairs,
+    }
+    for market, pairs in (("futures", futures_pairs), ("spot", spot_pairs)):
+        counts = shared["pair_counts"][market]
+        merged = shared[f"merged_{market}"]
+        uids = shared["all_price_uids"]
+        for pair in pairs:
+            counts[pair] += 1
+            merged.add(pair)
+            uids.add(f"binance_{market}_{pair}")
+
+
+def _unregister_pairs(shared: dict, entry_id: str) -> None:
+    """Drop an entry's pairs, pruning symbols whose refcount hits zero."""
+    pairs = shared["pair_registry"].pop(entry_id, None)
+    if not pairs:
+        return
+    for market in ("futures", "spot"):
+        counts = shared["pair_counts"][market]
+        merged = shared[f"merged_{market}"]
+        uids = shared["all_price_uids"]
+        for pair in pairs.get(market, []):
+            counts[pair] -= 1
+            if counts[pair] <= 0:
+                del counts[pair]
+                merged.discard(pair)
+                uids.discard(f"binance_{market}_{pair}")
+
+
+def _normalize_rest_ticker(item: dict) -> Ticker:
+    """Reduce a REST 24hr ticker to the fields sensors read, pre-parsed.
+
+    Numeric fields are converted to float exactly once, at ingestion;
+    websocket._normalize_ws_ticker produces the same Ticker records so
+    sensors never parse strings on state reads.
+    """
+    return Ticker(
+        symbol=item["symbol"],
+        last_price=float(item.get("lastPrice", 0)),
+        price_change_percent=float(item.get("priceChangePercent", 0)),
+        high_price=float(item.get("highPrice", 0)),
+        low_price=float(item.get("lowPrice", 0)),
+        volume=float(item.get("volume", 0)),
+        quote_volume=float(item.get("quoteVolume", 0)),
+    )
+
+
+@dataclass(frozen=True)
+class _SignedEndpoint:
+    """A signed GET endpoint with its constant query-string prefix.
+
+    Only the timestamp varies between calls, so everything else is built
+    once and reused across polls.
+    """
+
+    url: str
+    base_qs: str = "recvWindow=10000"
 
 
 async def _request(
     session: aiohttp.ClientSession,
     url: str,
     *,
-    api_key: str | None = None,
-    api_secret: str | None = None,
-    signed: bool = False,
-    params: dict | None = None,
+    headers: dict | None = None,
+    sem: asyncio.Semaphore | None = None,
 ) -> list | dict:
-    """GET request with optional HMAC signing and rate-limit detection."""
-    headers: dict[str, str] = {}
-    if signed and api_key and api_secret:
-        headers["X-MBX-APIKEY"] = api_key
-        params = params or {}
-        params["timestamp"] = int(time.time() * 1000)
-        params["recvWindow"] = 10000
-        qs = "&".join(f"{k}={v}" for k, v in params.items())
-        params["signature"] = hmac.new(
-            api_secret.encode(), qs.encode(), hashlib.sha256
-        ).hexdigest()
-
-    async with session.get(url, headers=headers, params=params) as resp:
-        if resp.status in (HTTPStatus.TOO_MANY_REQUESTS, 418):
-            retry = int(resp.headers.get("Retry-After", RATE_LIMIT_BACKOFF_BASE))
-            raise UpdateFailed(
-                f"Binance rate limit (HTTP {resp.status}), back off {retry}s"
-            )
-        resp.raise_for_status()
-        return await resp.json()
+    """GET request with rate-limit detection, optionally bounded by *sem*.
+
+    Callers pass fully-built URLs so aiohttp never re-encodes params.
+    """
+    async with sem if sem is not None else nullcontext():
+        async with session.get(
+            url, headers=headers, timeout=_REQUEST_TIMEOUT
+        ) as resp:
+            if resp.status in (HTTPStatus.TOO_MANY_REQUESTS, 418):
+                retry = int(
+                    resp.headers.get("Retry-After", RATE_LIMIT_BACKOFF_BASE)
+                )
+                raise UpdateFailed(
+                    f"Binance rate limit (HTTP {resp.status}), back off {retry}s"
+                )
+            resp.raise_for_status()
+            return await resp.json(loads=_json_loads)
+
+
+async def _signed_request(
+    session: aiohttp.ClientSession,
+    endpoint: _SignedEndpoint,
+    api_key: str,
+    api_secret: bytes,
+    sem: asyncio.Semaphore | None = None,
+    timestamp: int | None = None,
+) -> list | dict:
+    """GET a signed endpoint; only the timestamp is computed per call.
+
+    Callers firing several signed requests in one refresh pass a shared
+    *timestamp* — Binance accepts anything within recvWindow, so one
+    clock sample covers them all. The full URL is assembled here so
+    aiohttp does not re-encode params.
+    """
+    if timestamp is None:
+        timestamp = int(time.time() * 1000)
+    qs = f"{endpoint.base_qs}&timestamp={timestamp}"
+    # One-shot hmac.digest() hits the OpenSSL fast path (bpo-32433).
+    signature = hmac.digest(api_secret, qs.encode(), "sha256").hex()
+    return await _request(
+        session,
+        f"{endpoint.url}?{qs}&signature={signature}",
+        headers={"X-MBX-APIKEY": api_key},
+        sem=sem,
+    )
+
+
+async def _warm_connections(session: aiohttp.ClientSession) -> None:
+    """Ping both API hosts so DNS + TLS handshakes happen off the critical path.
+
+    Best effort: the first refresh works either way, it just reuses the
+    already-warm keepalive connections when this succeeds.
+    """
+
+    async def _ping(url: str) -> None:
+        try:
+            async with asyncio.timeout(5):
+                async with session.get(url) as resp:
+                    resp.raise_for_status()
+        except Exception as err:
+            _LOGGER.debug("Warm-up ping %s failed: %s", url, err)
+
+    await asyncio.gather(
+        _ping(f"{SPOT_API_URL}/api/v3/ping"),
+        _ping(f"{FUTURES_API_URL}/fapi/v1/ping"),
+    )
 
 
 # ======================================================================
@@ -136,78 +287,228 @@ class BinancePriceCoordinator(DataUpdateCoordinator):
         session: aiohttp.ClientSession,
         update_interval: int,
         use_websocket: bool,
+        api_sem: asyncio.Semaphore,
     ) -> None:
         self.session = session
         self.use_websocket = use_websocket
+        self._api_sem = api_sem
         self._backoff_until: float = 0
+        self._ws_flush_handle: asyncio.TimerHandle | None = None
+        self._ws_last_flush: float = 0.0
+        # Configured pairs Binance doesn't serve (delisted or invalid).
+        # Excluded from requests and coverage checks so one stale option
+        # can't re-trigger full downloads every cycle; re-probed only
+        # after a restart.
+        self._unserved_futures: set[str] = set()
+        self._unserved_spot: set[str] = set()
 
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_price",
             update_interval=timedelta(seconds=update_interval),
+            # Payloads are plain dicts of primitives, so an unchanged
+            # poll compares equal and skips the listener fan-out.
+            always_update=False,
         )
 
+    def notify_ws_update(self) -> None:
+        """Flush listeners after in-place WS updates, coalescing bursts.
+
+        A frame arriving after a quiet spell is pushed immediately so a
+        lone tick isn't delayed; during bursts a single trailing flush is
+        scheduled, capping fan-out at one per WS_FLUSH_INTERVAL no matter
+        how fast frames arrive.
+        """
+        if self._ws_flush_handle is not None:
+            return
+        if time.monotonic() - self._ws_last_flush >= WS_FLUSH_INTERVAL:
+            self._flush_ws()
+        else:
+            self._ws_flush_handle = self.hass.loop.call_later(
+                WS_FLUSH_INTERVAL, self._flush_ws
+            )
+
+    def _flush_ws(self) -> None:
+        # The websocket already mutated self.data in place; just notify.
+        # async_set_updated_data would re-assign data to itself and reset
+        # the polling interval for no benefit.
+        self._ws_flush_handle = None
+        self._ws_last_flush = time.monotonic()
+        self.async_update_listeners()
+
+    def cancel_ws_flush(self) -> None:
+        """Cancel any pending flush (shared-layer teardown)."""
+        if self._ws_flush_handle is not None:
+            self._ws_flush_handle.cancel()
+            self._ws_flush_handle = None
+
     async def _async_update_data(self) -> dict:
         remaining = self._backoff_until - time.monotonic()
         if remaining > 0:
             raise UpdateFailed(f"Rate-limit backoff, {remaining:.0f}s left")
 
+        # Only keep tickers somebody configured; the 24hr endpoints return
+        # thousands of symbols and everything else is thrown away.
+        shared = self.hass.data.get(DOMAIN, {}).get(SHARED_KEY)
+        if shared:
+            all_futures, all_spot = _merged_pairs(shared)
+            wanted_futures = frozenset(all_futures)
+            wanted_spot = frozenset(all_spot)
+        else:
+            wanted_futures = wanted_spot = frozenset()
+
+        # Pairs Binance is known not to serve can never be covered;
+        # leaving them in would make need_rest true forever and re-issue
+        # doomed requests every cycle.
+        covered_futures = wanted_futures - self._unserved_futures
+        covered_spot = wanted_spot - self._unserved_spot
+
         try:
-            async with asyncio.timeout(30):
-                tasks: dict[str, any] = {}
+            tasks: dict[str, any] = {}
+
+            existing = self.data or {}
 
-                # Always REST on first load; afterwards skip if WS is active.
-                need_rest = not self.use_websocket or self.data is None
-                if need_rest:
+            # REST on first load or when a newly registered pair is not
+            # covered yet; afterwards skip if WS is active.
+            need_rest = (
+                not self.use_websocket
+                or self.data is None
+                or not covered_futures <= existing.get(FUTURES_DATA, {}).keys()
+                or not covered_spot <= existing.get(SPOT_DATA, {}).keys()
+            )
+            if need_rest:
+                if covered_futures:
                     tasks["futures"] = _request(
-                        self.session, f"{FUTURES_API_URL}/fapi/v1/ticker/24hr"
+                        self.session,
+                        f"{FUTURES_API_URL}/fapi/v1/ticker/24hr",
+                        sem=self._api_sem,
+                    )
+                if covered_spot:
+                    # Spot supports symbols=[...]; ask only for the pairs
+                    # we track instead of downloading the whole market.
+                    # (The futures endpoint has no such parameter, hence
+                    # the full fetch + filter above.)
+                    symbols_param = (
+                        "%5B"
+                        + ",".join(f"%22{s}%22" for s in sorted(covered_spot))
+                        + "%5D"
                     )
                     tasks["spot"] = _request(
-                        self.session, f"{SPOT_API_URL}/api/v3/ticker/24hr"
+                        self.session,
+                        f"{SPOT_API_URL}/api/v3/ticker/24hr"
+                        f"?symbols={symbols_param}",
+                        sem=self._api_sem,
                     )
 
+            # The websocket streams btcusdt@ticker whenever it runs (it
+            # injects BTCUSDT into the spot connection), so REST is only
+            # needed until the first streamed price arrives. The manager
+            # never starts without configured pairs, so wallet-only
+            # setups must keep polling the reference price every cycle —
+            # the use_websocket flag alone doesn't guarantee a stream.
+            ws = shared.get("ws_manager") if shared else None
+            ws_streaming = ws is not None and ws.is_running
+            if not ws_streaming or existing.get(BTCUSDT_PRICE) is None:
                 tasks["btcusdt"] = _request(
                     self.session,
-                    f"{SPOT_API_URL}/api/v3/ticker/price",
-                    params={"symbol": "BTCUSDT"},
+                    f"{SPOT_API_URL}/api/v3/ticker/price?symbol=BTCUSDT",
+                    sem=self._api_sem,
                 )
 
-                keys = list(tasks.keys())
-                results = await asyncio.gather(
-                    *tasks.values(), return_exceptions=True
+            keys = list(tasks.keys())
+            results = await asyncio.gather(
+                *tasks.values(), return_exceptions=True
+            )
+            fetched = dict(zip(keys, results))
+
+            # symbols=[...] is all-or-nothing: Binance rejects the whole
+            # request with a 400 if any one pair has been delisted. Fall
+            # back to the unfiltered list (the membership filter below
+            # still applies) so one stale option degrades to a single
+            # missing sensor instead of blacking out the spot market.
+            spot_result = fetched.get("spot")
+            if (
+                isinstance(spot_result, aiohttp.ClientResponseError)
+                and spot_result.status == HTTPStatus.BAD_REQUEST
+            ):
+                _LOGGER.warning(
+                    "Spot symbols request rejected (%s); retrying unfiltered",
+                    spot_result.message,
                 )
-                fetched = dict(zip(keys, results))
-
-                for k, v in fetched.items():
-                    if isinstance(v, Exception):
-                        _LOGGER.warning("Price fetch %s failed: %s", k, v)
+                try:
+                    fetched["spot"] = await _request(
+                        self.session,
+                        f"{SPOT_API_URL}/api/v3/ticker/24hr",
+                        sem=self._api_sem,
+                    )
+                except Exception as err:
+                    # Recorded like any other failed fetch below.
+                    fetched["spot"] = err
 
-                existing = self.data or {}
+            for k, v in fetched.items():
+                if isinstance(v, Exception):
+                    _LOGGER.warning("Price fetch %s failed: %s", k, v)
 
-                futures_data = (
-                    {i["symbol"]: i for i in fetched["futures"]}
-                    if "futures" in fetched
-                    and not isinstance(fetched["futures"], Exception)
-                    else existing.get(FUTURES_DATA, {})
-                )
-                spot_data = (
-                    {i["symbol"]: i for i in fetched["spot"]}
-                    if "spot" in fetched
-                    and not isinstance(fetched["spot"], Exception)
-                    else existing.get(SPOT_DATA, {})
-                )
-                btcusdt = (
-                    float(fetched["btcusdt"]["price"])
-                    if not isinstance(fetched.get("btcusdt"), Exception)
-                    else existing.get(BTCUSDT_PRICE)
-                )
+            futures_ok = "futures" in fetched and not isinstance(
+                fetched["futures"], Exception
+            )
+            spot_ok = "spot" in fetched and not isinstance(
+                fetched["spot"], Exception
+            )
 
-                return {
-                    FUTURES_DATA: futures_data,
-                    SPOT_DATA: spot_data,
-                    BTCUSDT_PRICE: btcusdt,
+            futures_data = (
+                {
+                    i["symbol"]: _normalize_rest_ticker(i)
+                    for i in fetched["futures"]
+                    if i["symbol"] in wanted_futures
                 }
+                if futures_ok
+                else existing.get(FUTURES_DATA, {})
+            )
+            spot_data = (
+                {
+                    i["symbol"]: _normalize_rest_ticker(i)
+                    for i in fetched["spot"]
+                    if i["symbol"] in wanted_spot
+                }
+                if spot_ok
+                else existing.get(SPOT_DATA, {})
+            )
+
+            # Anything a successful fetch didn't return isn't served by
+            # Binance anymore; remember it (warning once, not per cycle)
+            # so the next poll neither requests it nor counts it as
+            # missing coverage.
+            for market, ok, covered, data, unserved in (
+                ("futures", futures_ok, covered_futures,
+                 futures_data, self._unserved_futures),
+                ("spot", spot_ok, covered_spot,
+                 spot_data, self._unserved_spot),
+            ):
+                if not ok:
+                    continue
+                missing = covered - data.keys()
+                if missing:
+                    unserved |= missing
+                    _LOGGER.warning(
+                        "Binance no longer serves %s pair(s) %s; "
+                        "ignoring until restart",
+                        market,
+                        ", ".join(sorted(missing)),
+                    )
+            btcusdt = (
+                float(fetched["btcusdt"]["price"])
+                if "btcusdt" in fetched
+                and not isinstance(fetched["btcusdt"], Exception)
+                else existing.get(BTCUSDT_PRICE)
+            )
+
+            return {
+                FUTURES_DATA: futures_data,
+                SPOT_DATA: spot_data,
+                BTCUSDT_PRICE: btcusdt,
+            }
 
         except UpdateFailed:
             raise
@@ -234,17 +535,31 @@ class BinanceAccountCoordinator(DataUpdateCoordinator):
         api_key: str,
         api_secret: str,
         update_interval: int,
+        api_sem: asyncio.Semaphore,
     ) -> None:
         self.session = session
         self.api_key = api_key
-        self.api_secret = api_secret
+        self._api_sem = api_sem
+        # Encode the secret once; hmac.digest() wants bytes on every call.
+        self._api_secret_bytes = api_secret.encode()
+        self._wallet_endpoint = _SignedEndpoint(
+            f"{SPOT_API_URL}/sapi/v1/asset/wallet/balance"
+        )
+        self._pnl_endpoint = _SignedEndpoint(
+            f"{FUTURES_API_URL}/fapi/v2/positionRisk"
+        )
         self._backoff_until: float = 0
 
+        # Jitter the interval per entry so multiple accounts drift apart
+        # instead of hitting the signed endpoints in the same second.
+        jitter = random.uniform(0, min(10, update_interval / 10))
+
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_account",
-            update_interval=timedelta(seconds=update_interval),
+            update_interval=timedelta(seconds=update_interval + jitter),
+            always_update=False,
         )
 
     async def _async_update_data(self) -> dict:
@@ -253,50 +568,70 @@ class BinanceAccountCoordinator(DataUpdateCoordinator):
             raise UpdateFailed(f"Rate-limit backoff, {remaining:.0f}s left")
 
         try:
-            async with asyncio.timeout(30):
-                wallet_task = _request(
-                    self.session,
-                    f"{SPOT_API_URL}/sapi/v1/asset/wallet/balance",
-                    api_key=self.api_key,
-                    api_secret=self.api_secret,
-                    signed=True,
-                )
-                pnl_task = _request(
-                    self.session,
-                    f"{FUTURES_API_URL}/fapi/v2/positionRisk",
-                    api_key=self.api_key,
-                    api_secret=self.api_secret,
-                    signed=True,
-                )
+            # One clock sample signs both requests of this refresh.
+            ts = int(time.time() * 1000)
+
+            wallet_task = _signed_request(
+                self.session,
+                self._wallet_endpoint,
+                self.api_key,
+                self._api_secret_bytes,
+                sem=self._api_sem,
+                timestamp=ts,
+            )
+            pnl_task = _signed_request(
+                self.session,
+                self._pnl_endpoint,
+                self.api_key,
+                self._api_secret_bytes,
+                sem=self._api_sem,
+                timestamp=ts,
+            )
 
-                wallet_raw, pnl_raw = await asyncio.gather(
-                    wallet_task, pnl_task, return_exceptions=True
-                )
+            wallet_raw, pnl_raw = await asyncio.gather(
+                wallet_task, pnl_task, return_exceptions=True
+            )
 
-                existing = self.data or {}
-
-                # Wallet
-                if isinstance(wallet_raw, Exception):
-                    _LOGGER.warning("Wallet fetch failed: %s", wallet_raw)
-                    wallet_data = existing.get(WALLET_DATA, {})
-                else:
-                    wallet_data = {
-                        item["walletName"]: float(item["balance"])
-                        for item in wallet_raw
-                    }
-
-                # PnL — keep only open positions
-                if isinstance(pnl_raw, Exception):
-                    _LOGGER.warning("PnL fetch failed: %s", pnl_raw)
-                    pnl_data = existing.get(PNL_DATA, [])
-                else:
-                    pnl_data = [
+            existing = self.data or {}
+
+            # Wallet
+            if isinstance(wallet_raw, Exception):
+                _LOGGER.warning("Wallet fetch failed: %s", wallet_raw)
+                wallet_data = existing.get(WALLET_DATA, {})
+            else:
+                # Wallet names come from a small fixed set; interning
+                # them makes the per-sensor lookups pointer comparisons.
+                wallet_data = {
+                    sys.intern(item["walletName"]): float(item["balance"])
+                    for item in wallet_raw
+                }
+
+            # PnL — keep only open positions
+            if isinstance(pnl_raw, Exception):
+                _LOGGER.warning("PnL fetch failed: %s", pnl_raw)
+                pnl_data = existing.get(PNL_DATA, [])
+            else:
+                # Parse positionAmt once per entry; positionRisk returns
+                # hundreds of flat positions that are filtered out before
+                # any of the other fields are converted.
+                pnl_data = []
+                for p in pnl_raw:
+                    amt_str = p.get("positionAmt")
+                    if not amt_str or amt_str in _ZERO_AMTS:
+                        continue
+                    # Unusual formats (e.g. "-0.000") still parse here.
+                    amt = float(amt_str)
+                    if amt == 0:
+                        continue
+                    pnl_data.append(
                         {
                             "symbol": p["symbol"],
-                            "positionAmt": float(p["positionAmt"]),
+                            "positionAmt": amt,
                             "entryPrice": float(p["entryPrice"]),
                             "markPrice": float(p["markPrice"]),
-                            "unRealizedProfit": float(p["unRealizedProfit"]),
+                            "unRealizedProfit": float(
+                                p["unRealizedProfit"]
+                            ),
                             "liquidationPrice": float(
                                 p.get("liquidationPrice", 0)
                             ),
@@ -304,11 +639,17 @@ class BinanceAccountCoordinator(DataUpdateCoordinator):
                             "marginType": p.get("marginType", "cross"),
                             "positionSide": p.get("positionSide", "BOTH"),
                         }
-                        for p in pnl_raw
-                        if float(p.get("positionAmt", 0)) != 0
-                    ]
+                    )
 
-                return {WALLET_DATA: wallet_data, PNL_DATA: pnl_data}
+            # Aggregate once per refresh so sensors read a plain value
+            # instead of re-summing positions on every state access.
+            return {
+                WALLET_DATA: wallet_data,
+                PNL_DATA: pnl_data,
+                PNL_TOTAL: round(
+                    sum(p["unRealizedProfit"] for p in pnl_data), 2
+                ),
+            }
 
         except UpdateFailed:
             raise
@@ -338,27 +679,40 @@ async def _ensure_shared(
     interval = entry.options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
 
     shared = domain_data.get(SHARED_KEY)
+    bootstrap = shared is None
 
-    if shared is None:
+    if bootstrap:
         # First entry — bootstrap shared layer.
+        api_sem = asyncio.Semaphore(REST_CONCURRENCY_LIMIT)
         coordinator = BinancePriceCoordinator(
-            hass, session, interval, use_ws,
+            hass, session, interval, use_ws, api_sem,
         )
         shared = {
             "price_coordinator": coordinator,
             "ws_manager": None,
             "pair_registry": {},
+            "merged_futures": set(),
+            "merged_spot": set(),
+            "pair_counts": {"futures": Counter(), "spot": Counter()},
+            "all_price_uids": set(),
             "use_websocket": use_ws,
+            "api_sem": api_sem,
+            "account_coordinators": {},
         }
         domain_data[SHARED_KEY] = shared
 
-        await coordinator.async_config_entry_first_refresh()
+    # Register this entry's pairs before refreshing so the coordinator
+    # knows which tickers to keep.
+    _register_pairs(shared, entry.entry_id, futures_pairs, spot_pairs)
 
-    # Register this entry's pairs.
-    shared["pair_registry"][entry.entry_id] = {
-        "futures": futures_pairs,
-        "spot": spot_pairs,
-    }
+    if bootstrap:
+        # Two cheap parallel pings beat paying serial DNS+TLS handshakes
+        # inside the first refresh.
+        await _warm_connections(session)
+        await shared["price_coordinator"].async_config_entry_first_refresh()
+    else:
+        # Pick up any pairs this entry added that aren't covered yet.
+        await shared["price_coordinator"].async_request_refresh()
 
     # Restart WebSocket with merged pairs.
     await _refresh_websocket(hass)
@@ -383,6 +737,10 @@ async def _refresh_websocket(hass: HomeAssistant) -> None:
         if ws is None:
             ws = BinanceWebSocketManager(hass, coordinator, session)
             shared["ws_manager"] = ws
+        elif ws.subscription == (frozenset(all_spot), frozenset(all_futures)):
+            # Same pair union (e.g. a new entry subscribing a subset) —
+            # keep the live connections instead of a reconnect round trip.
+            return
         else:
             await ws.stop()
 
@@ -398,13 +756,14 @@ async def _unregister_shared(hass: HomeAssistant, entry_id: str) -> None:
     if not shared:
         return
 
-    shared["pair_registry"].pop(entry_id, None)
+    _unregister_pairs(shared, entry_id)
 
     if not shared["pair_registry"]:
         # Last entry — tear down.
         ws: BinanceWebSocketManager | None = shared.get("ws_manager")
         if ws:
             await ws.stop()
+        shared["price_coordinator"].cancel_ws_flush()
         hass.data[DOMAIN].pop(SHARED_KEY, None)
     else:
         await _refresh_websocket(hass)
@@ -431,18 +790,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # --- Shared price coordinator ---
     shared = await _ensure_shared(hass, entry, futures_pairs, spot_pairs)
 
-    # --- Per-account coordinator ---
-    account_coordinator = BinanceAccountCoordinator(
-        hass,
-        session,
-        api_key=entry.data[CONF_API_KEY],
-        api_secret=entry.data[CONF_API_SECRET],
-        update_interval=interval,
-    )
-    await account_coordinator.async_config_entry_first_refresh()
+    # --- Per-account coordinator (shared between entries with the same
+    # API key, keyed by a hash so the raw key never lands in hass.data) ---
+    key_id = hashlib.sha256(entry.data[CONF_API_KEY].encode()).hexdigest()[:16]
+    slot = shared["account_coordinators"].get(key_id)
+
+    if slot is None:
+        account_coordinator = BinanceAccountCoordinator(
+            hass,
+            session,
+            api_key=entry.data[CONF_API_KEY],
+            api_secret=entry.data[CONF_API_SECRET],
+            update_interval=interval,
+            api_sem=shared["api_sem"],
+        )
+        await account_coordinator.async_config_entry_first_refresh()
+        shared["account_coordinators"][key_id] = {
+            "coordinator": account_coordinator,
+            "refs": 1,
+        }
+    else:
+        _LOGGER.debug("Reusing account coordinator for duplicate API key")
+        slot["refs"] += 1
+        account_coordinator = slot["coordinator"]
 
     hass.data[DOMAIN][entry.entry_id] = {
         "account_coordinator": account_coordinator,
+        "account_key_id": key_id,
     }
 
     entry.async_on_unload(entry.add_update_listener(_options_update_listener))
@@ -455,6 +829,17 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id, None)
+
+        # Release the (possibly shared) account coordinator.
+        shared = hass.data[DOMAIN].get(SHARED_KEY)
+        if shared and entry_data:
+            key_id = entry_data.get("account_key_id")
+            slot = shared["account_coordinators"].get(key_id)
+            if slot:
+                slot["refs"] -= 1
+                if slot["refs"] <= 0:
+                    shared["account_coordinators"].pop(key_id, None)
+
         await _unregister_shared(hass, entry.entry_id)
     return unload_ok
@@ -1,6 +1,6 @@
 """Config flow for Binance integration."""
 
-import hashlib
+import asyncio
 import hmac
 import logging
 import time
@@ -9,9 +9,11 @@ import aiohttp
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+from homeassistant.util.json import json_loads
 
 from .const import (
     CONF_ACCOUNT_NAME,
@@ -31,31 +33,83 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 # --- Symbol cache ---
+# Two layers: a module-level dict for repeat flow steps in one session,
+# and a Store so a fresh HA restart doesn't re-download the lists.
 _symbol_cache: dict = {"futures": [], "spot": [], "ts": 0.0}
 _CACHE_TTL = 300  # 5 minutes
+_STORE_TTL = 86400  # 1 day; tradable symbols change rarely
+_STORE_VERSION = 1
 
+# Serializes cache misses so concurrent flow steps share one fetch
+# instead of both hitting Binance (cache-stampede protection).
+_fetch_lock = asyncio.Lock()
 
-async def _get_symbols(session: aiohttp.ClientSession) -> tuple[list[str], list[str]]:
+# Constant tail of the signed validation query string.
+_RECV_SUFFIX = "&recvWindow=10000"
+
+
+async def _get_symbols(hass: HomeAssistant) -> tuple[list[str], list[str]]:
     """Fetch and cache available trading symbols from Binance."""
-    now = time.monotonic()
+    now = time.time()
     if _symbol_cache["ts"] > now - _CACHE_TTL and _symbol_cache["futures"]:
         return _symbol_cache["futures"], _symbol_cache["spot"]
 
-    async with session.get(f"{FUTURES_API_URL}/fapi/v2/ticker/price") as resp:
-        resp.raise_for_status()
-        futures_data = await resp.json()
-        futures_symbols = sorted(item["symbol"] for item in futures_data)
-
-    async with session.get(f"{SPOT_API_URL}/api/v3/ticker/24hr") as resp:
-        resp.raise_for_status()
-        spot_data = await resp.json()
-        spot_symbols = sorted(
-            item["symbol"]
-            for item in spot_data
-            if float(item.get("weightedAvgPrice", 0)) > 0
+    async with _fetch_lock:
+        return await _load_symbols(hass)
+
+
+async def _load_symbols(hass: HomeAssistant) -> tuple[list[str], list[str]]:
+    """Load symbols from cache, disk, or Binance (behind _fetch_lock)."""
+    now = time.time()
+    # A concurrent caller may have populated the cache while we waited.
+    if _symbol_cache["ts"] > now - _CACHE_TTL and _symbol_cache["futures"]:
+        return _symbol_cache["futures"], _symbol_cache["spot"]
+
+    store = Store(hass, _STORE_VERSION, f"{DOMAIN}_symbols")
+    stored = await store.async_load()
+    if (
+        stored
+        and stored.get("futures")
+        and stored.get("ts", 0) > now - _STORE_TTL
+    ):
+        _symbol_cache.update(
+            {"futures": stored["futures"], "spot": stored["spot"], "ts": now}
         )
+        return stored["futures"], stored["spot"]
+
+    session = async_get_clientsession(hass)
+
+    # exchangeInfo returns symbols + status only — an order of magnitude
+    # less JSON than the 24hr ticker endpoints used before.
+    async def _fetch_futures() -> list[str]:
+        async with session.get(f"{FUTURES_API_URL}/fapi/v1/exchangeInfo") as resp:
+            resp.raise_for_status()
+            data = await resp.json(loads=json_loads)
+            return sorted(
+                s["symbol"]
+                for s in data["symbols"]
+                if s.get("status") == "TRADING"
+            )
+
+    async def _fetch_spot() -> list[str]:
+        async with session.get(f"{SPOT_API_URL}/api/v3/exchangeInfo") as resp:
+            resp.raise_for_status()
+            data = await resp.json(loads=json_loads)
+            return sorted(
+                s["symbol"]
+                for s in data["symbols"]
+                if s.get("status") == "TRADING" and s.get("isSpotTradingAllowed")
+            )
+
+    # The two endpoints are independent; fetch them concurrently.
+    futures_symbols, spot_symbols = await asyncio.gather(
+        _fetch_futures(), _fetch_spot()
+    )
 
     _symbol_cache.update({"futures": futures_symbols, "spot": spot_symbols, "ts": now})
+    await store.async_save(
+        {"futures": futures_symbols, "spot": spot_symbols, "ts": now}
+    )
     return futures_symbols, spot_symbols
 
 
@@ -65,12 +119,11 @@ async def _validate_api_credentials(
     """Test API credentials. Returns error key or None on success."""
     try:
         timestamp = int(time.time() * 1000)
-        query_string = f"timestamp={timestamp}&recvWindow=10000"
-        signature = hmac.new(
-            api_secret.encode("utf-8"),
-            query_string.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
+        query_string = f"timestamp={timestamp}{_RECV_SUFFIX}"
+        # Same one-shot OpenSSL path the coordinators use for signing.
+        signature = hmac.digest(
+            api_secret.encode("utf-8"), query_string.encode("utf-8"), "sha256"
+        ).hex()
 
         url = (
             f"{SPOT_API_URL}/sapi/v1/asset/wallet/balance"
@@ -120,7 +173,7 @@ class BinanceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         spot_symbols: list[str] = []
 
         try:
-            futures_symbols, spot_symbols = await _get_symbols(session)
+            futures_symbols, spot_symbols = await _get_symbols(self.hass)
         except aiohttp.ClientError:
             errors["base"] = "cannot_connect"
         except Exception:
@@ -164,10 +217,8 @@ class BinanceOptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
-        session = async_get_clientsession(self.hass)
-
         try:
-            futures_symbols, spot_symbols = await _get_symbols(session)
+            futures_symbols, spot_symbols = await _get_symbols(self.hass)
         except aiohttp.ClientError:
             return self.async_abort(reason="cannot_connect")
         except Exception:
@@ -26,6 +26,7 @@ BTCUSDT_PRICE = "btcusdt_price"
 # --- Data Keys (per-account coordinator) ---
 WALLET_DATA = "wallet_data"
 PNL_DATA = "pnl_data"
+PNL_TOTAL = "pnl_total"
 
 # --- hass.data layout keys ---
 SHARED_KEY = "_shared"
@@ -39,12 +40,16 @@ SPOT_WS_URL = "wss://stream.binance.com:9443/stream"
 FUTURES_WS_URL = "wss://fstream.binance.com/stream"
 
 # --- WebSocket ---
-WS_MAX_STREAMS_PER_CONNECTION = 200
+# Binance allows 1024 streams per connection; staying at that limit
+# means one connection (and one consumer task) per market in practice.
+WS_MAX_STREAMS_PER_CONNECTION = 1024
 WS_RECONNECT_DELAY = 5  # seconds
+WS_FLUSH_INTERVAL = 0.25  # seconds; debounce for listener updates
 
 # --- Rate Limit ---
 RATE_LIMIT_BACKOFF_BASE = 5  # seconds
 RATE_LIMIT_BACKOFF_MAX = 300  # 5 minutes max backoff
+REST_CONCURRENCY_LIMIT = 6  # max in-flight REST requests across coordinators
 
 
 @dataclass(frozen=True)
@@ -93,14 +98,9 @@ QUOTE_ASSET_CONFIG: dict[str, QuoteAssetInfo] = {
     "DOGE": QuoteAssetInfo("DOGE", "mdi:dog"),
 }
 
-# Pre-sorted keys: longest suffix first for unambiguous matching.
-QUOTE_ASSET_KEYS_SORTED: list[str] = sorted(
-    QUOTE_ASSET_CONFIG.keys(), key=len, reverse=True
-)
-
 # Fiat units eligible for SensorDeviceClass.MONETARY.
-FIAT_UNITS: set[str] = {
+FIAT_UNITS: frozenset[str] = frozenset({
     "USD", "EUR", "TRY", "BRL", "UAH", "GBP", "JPY", "RUB",
     "PLN", "RON", "ARS", "MXN", "COP", "CZK", "ZAR", "AUD",
     "IDR", "NGN",
-}
+})
@@ -1,6 +1,8 @@
 """Binance sensor entities."""
 
 import logging
+from functools import lru_cache
+from operator import itemgetter
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -8,9 +10,12 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
+from homeassistant.helpers.entity_registry import (
+    async_entries_for_config_entry,
+    async_get as async_get_entity_registry,
+)
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
@@ -21,8 +26,8 @@ from .const import (
     DOMAIN,
     FUTURES_DATA,
     PNL_DATA,
+    PNL_TOTAL,
     QUOTE_ASSET_CONFIG,
-    QUOTE_ASSET_KEYS_SORTED,
     SHARED_KEY,
     SPOT_DATA,
     WALLET_DATA,
@@ -30,27 +35,58 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Quote assets grouped by suffix length: resolution is a handful of dict
+# lookups (longest suffix first) instead of a linear endswith() scan.
+_QA_BY_LEN: dict[int, dict[str, str]] = {}
+for _asset in QUOTE_ASSET_CONFIG:
+    _QA_BY_LEN.setdefault(len(_asset), {})[_asset] = _asset
+_QA_LENS: tuple[int, ...] = tuple(sorted(_QA_BY_LEN, reverse=True))
+
+
+@lru_cache(maxsize=256)
+def _slug(name: str) -> str:
+    """Lowercase-underscore a display name for unique IDs.
+
+    Account and wallet names recur across sensors and reloads, so the
+    formatted forms are memoized.
+    """
+    return name.lower().replace(" ", "_")
+
+
+# One C-level multi-key fetch per position row in the PnL attributes.
+_PNL_FIELDS = itemgetter(
+    "positionAmt", "entryPrice", "markPrice", "unRealizedProfit",
+    "leverage", "marginType", "liquidationPrice",
+)
 
+
+@lru_cache(maxsize=4096)
 def _resolve_quote_asset(symbol: str) -> str | None:
-    """Return the quote asset suffix for *symbol*, or None if unknown."""
-    for asset in QUOTE_ASSET_KEYS_SORTED:
-        if symbol.endswith(asset) and len(symbol) > len(asset):
-            return asset
+    """Return the quote asset suffix for *symbol*, or None if unknown.
+
+    Pure function of the symbol (the key table is frozen at module
+    load), and the same symbols recur across entries and reloads, so
+    results are cached.
+    """
+    n = len(symbol)
+    for length in _QA_LENS:
+        if n > length:
+            asset = _QA_BY_LEN[length].get(symbol[-length:])
+            if asset:
+                return asset
     return None
 
 
 def _all_desired_price_uids(hass: HomeAssistant) -> set[str]:
-    """Collect desired price sensor unique IDs across ALL config entries."""
-    uids: set[str] = set()
+    """Desired price sensor unique IDs across ALL config entries.
+
+    Maintained incrementally by the shared layer on entry add/remove;
+    callers only test membership.
+    """
     shared = hass.data.get(DOMAIN, {}).get(SHARED_KEY)
     if not shared:
-        return uids
-    for pairs in shared["pair_registry"].values():
-        for pair in pairs.get("futures", []):
-            uids.add(f"binance_futures_{pair}")
-        for pair in pairs.get("spot", []):
-            uids.add(f"binance_spot_{pair}")
-    return uids
+        return set()
+    return shared["all_price_uids"]
 
 
 async def async_setup_entry(
@@ -77,39 +113,38 @@ async def async_setup_entry(
     )
 
     # --- Build desired unique IDs for THIS entry's own entities ---
-    desired_own_uids: set[str] = set()
-
-    fmt_account = account_name.lower().replace(" ", "_")
+    # Wallet pairs, the PnL total, and the price sensors this entry
+    # claims, gathered in one set literal.
+    fmt_account = _slug(account_name)
     wallet_data = (account_coordinator.data or {}).get(WALLET_DATA, {})
-    for wallet_name in wallet_data:
-        fmt_name = wallet_name.lower().replace(" ", "_")
-        desired_own_uids.add(f"binance_wallet_{fmt_account}_{fmt_name}_btc")
-        desired_own_uids.add(f"binance_wallet_{fmt_account}_{fmt_name}_usdt")
-    desired_own_uids.add(f"binance_pnl_{fmt_account}_total")
-
-    # Price sensors this entry claims.
-    for pair in futures_pairs:
-        desired_own_uids.add(f"binance_futures_{pair}")
-    for pair in spot_pairs:
-        desired_own_uids.add(f"binance_spot_{pair}")
+    desired_own_uids: set[str] = {
+        f"binance_pnl_{fmt_account}_total",
+        *(
+            f"binance_wallet_{fmt_account}_{_slug(w)}_{cur}"
+            for w in wallet_data
+            for cur in ("btc", "usdt")
+        ),
+        *(f"binance_futures_{p}" for p in futures_pairs),
+        *(f"binance_spot_{p}" for p in spot_pairs),
+    }
 
     # Union of ALL entries' price UIDs (so we don't delete a sensor
     # that another entry still needs).
     all_price_uids = _all_desired_price_uids(hass)
 
     # --- Remove stale entities for THIS config entry ---
-    for entity in list(entity_registry.entities.values()):
-        if entity.config_entry_id != config_entry.entry_id:
-            continue
-        if entity.unique_id in desired_own_uids:
-            continue
-        # Don't remove if another entry still wants this price sensor.
-        if entity.unique_id in all_price_uids:
-            continue
-        _LOGGER.debug(
-            "Removing stale sensor: %s (%s)", entity.entity_id, entity.unique_id
-        )
-        entity_registry.async_remove(entity.entity_id)
+    # The helper uses the registry's config-entry index, so this walks
+    # only our own entities instead of the whole registry. Stale UIDs
+    # come from one set difference (also keeping price sensors another
+    # entry still wants) rather than per-entity membership branches,
+    # and the snapshot dict keeps removal safe while iterating.
+    current_uids = {
+        e.unique_id: e.entity_id
+        for e in async_entries_for_config_entry(entity_registry, entry_id)
+    }
+    for uid in current_uids.keys() - desired_own_uids - all_price_uids:
+        _LOGGER.debug("Removing stale sensor: %s (%s)", current_uids[uid], uid)
+        entity_registry.async_remove(current_uids[uid])
 
     # --- Create sensors ---
     sensors: list[SensorEntity] = []
@@ -146,20 +181,18 @@ async def async_setup_entry(
                     BinancePriceSensor(price_coordinator, pair, "spot")
                 )
 
-    # Wallet sensors — per-account.
+    # Wallet sensors — per-account. Format names once per wallet; the
+    # constructors reuse them for both currencies.
     for wallet_name in wallet_data:
-        sensors.append(
-            BinanceWalletSensor(
-                account_coordinator, price_coordinator,
-                wallet_name, account_name, entry_id, "btc",
-            )
-        )
-        sensors.append(
-            BinanceWalletSensor(
-                account_coordinator, price_coordinator,
-                wallet_name, account_name, entry_id, "usdt",
+        fmt_name = _slug(wallet_name)
+        for currency in ("btc", "usdt"):
+            sensors.append(
+                BinanceWalletSensor(
+                    account_coordinator, price_coordinator,
+                    wallet_name, account_name, entry_id, currency,
+                    fmt_account, fmt_name,
+                )
             )
-        )
 
     # PnL sensor — per-account.
     sensors.append(BinancePnlSensor(account_coordinator, account_name, entry_id))
@@ -194,35 +227,44 @@ class BinancePriceSensor(CoordinatorEntity, SensorEntity):
         else:
             self._attr_icon = "mdi:cash"
 
-    @property
-    def _symbol_data(self) -> dict | None:
+        # Ticker cached per coordinator update; properties are read far
+        # more often than the data changes. The shared coordinator may
+        # already hold data when the entity is created, so seed it here.
+        self._ticker = self._lookup_ticker()
+
+    def _lookup_ticker(self):
         data = self.coordinator.data
         if data and self._data_key in data:
             return data[self._data_key].get(self._symbol)
         return None
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._ticker = self._lookup_ticker()
+        super()._handle_coordinator_update()
+
     @property
     def available(self) -> bool:
-        return super().available and self._symbol_data is not None
+        return super().available and self._ticker is not None
 
     @property
     def native_value(self):
-        sym = self._symbol_data
+        sym = self._ticker
         if sym:
-            return float(sym.get("lastPrice", 0))
+            return sym.last_price
         return None
 
     @property
     def extra_state_attributes(self) -> dict:
-        sym = self._symbol_data
+        sym = self._ticker
         if not sym:
             return {}
         return {
-            "price_change_percent": float(sym.get("priceChangePercent", 0)),
-            "high_price": float(sym.get("highPrice", 0)),
-            "low_price": float(sym.get("lowPrice", 0)),
-            "volume": float(sym.get("volume", 0)),
-            "quote_volume": float(sym.get("quoteVolume", 0)),
+            "price_change_percent": sym.price_change_percent,
+            "high_price": sym.high_price,
+            "low_price": sym.low_price,
+            "volume": sym.volume,
+            "quote_volume": sym.quote_volume,
         }
 
     @property
@@ -251,6 +293,8 @@ class BinanceWalletSensor(CoordinatorEntity, SensorEntity):
         account_name: str,
         entry_id: str,
         currency: str,
+        fmt_account: str,
+        fmt_name: str,
     ) -> None:
         # CoordinatorEntity tracks the account coordinator for availability.
         super().__init__(account_coordinator)
@@ -260,9 +304,6 @@ class BinanceWalletSensor(CoordinatorEntity, SensorEntity):
         self._entry_id = entry_id
         self._account_name = account_name
 
-        fmt_account = account_name.lower().replace(" ", "_")
-        fmt_name = wallet_name.lower().replace(" ", "_")
-
         self._attr_unique_id = (
             f"binance_wallet_{fmt_account}_{fmt_name}_{currency}"
         )
@@ -280,39 +321,59 @@ class BinanceWalletSensor(CoordinatorEntity, SensorEntity):
             self._attr_device_class = SensorDeviceClass.MONETARY
             self._attr_state_class = SensorStateClass.TOTAL
 
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to both coordinators the USD value depends on.
+
+        CoordinatorEntity only tracks the account coordinator; the USDT
+        variant also derives state from the shared BTCUSDT price, which
+        must keep driving writes when balances are unchanged.
+        """
+        await super().async_added_to_hass()
+        if self._currency == "usdt":
+            self.async_on_remove(
+                self._price_coordinator.async_add_listener(
+                    self._handle_coordinator_update
+                )
+            )
+
+    def _read(self) -> tuple[float | None, float | None]:
+        """Return (btc_balance, btcusdt_price) in one lookup chain each.
+
+        available and native_value share this; the price is only chased
+        for the USDT variant, which is the only one that needs it.
+        """
+        data = self.coordinator.data
+        balance = (
+            data.get(WALLET_DATA, {}).get(self._wallet_name) if data else None
+        )
+        price = None
+        if self._currency == "usdt":
+            price_data = self._price_coordinator.data
+            if price_data:
+                price = price_data.get(BTCUSDT_PRICE)
+        return balance, price
+
     @property
     def available(self) -> bool:
         if not super().available:
             return False
-        data = self.coordinator.data
-        if not data or self._wallet_name not in data.get(WALLET_DATA, {}):
+        balance, price = self._read()
+        if balance is None:
             return False
-        if self._currency == "usdt":
-            price_data = self._price_coordinator.data
-            if not price_data or price_data.get(BTCUSDT_PRICE) is None:
-                return False
-        return True
+        return self._currency != "usdt" or price is not None
 
     @property
     def native_value(self):
-        data = self.coordinator.data
-        if not data:
-            return None
-
-        btc_balance = data.get(WALLET_DATA, {}).get(self._wallet_name)
-        if btc_balance is None:
+        balance, price = self._read()
+        if balance is None:
             return None
 
         if self._currency == "usdt":
-            price_data = self._price_coordinator.data
-            if not price_data:
-                return None
-            price = price_data.get(BTCUSDT_PRICE)
             if price is None:
                 return None
-            return round(btc_balance * price, 2)
+            return round(balance * price, 2)
 
-        return btc_balance
+        return balance
 
     @property
     def device_info(self) -> dict:
@@ -341,11 +402,14 @@ class BinancePnlSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self._entry_id = entry_id
         self._account_name = account_name
-        fmt_account = account_name.lower().replace(" ", "_")
 
-        self._attr_unique_id = f"binance_pnl_{fmt_account}_total"
+        self._attr_unique_id = f"binance_pnl_{_slug(account_name)}_total"
         self._attr_name = f"Binance {account_name} Futures PnL"
 
+        # Attributes are rebuilt once per coordinator update; HA reads
+        # the property far more often (state writes, template evals).
+        self._attr_extra_state_attributes = self._build_attrs()
+
     @property
     def _positions(self) -> list[dict]:
         data = self.coordinator.data
@@ -353,19 +417,23 @@ class BinancePnlSensor(CoordinatorEntity, SensorEntity):
             return data.get(PNL_DATA, [])
         return []
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._attr_extra_state_attributes = self._build_attrs()
+        super()._handle_coordinator_update()
+
     @property
     def available(self) -> bool:
         return super().available and self.coordinator.data is not None
 
     @property
     def native_value(self):
-        positions = self._positions
-        if not positions:
+        data = self.coordinator.data
+        if not data:
             return 0.0
-        return round(sum(p["unRealizedProfit"] for p in positions), 2)
+        return data.get(PNL_TOTAL, 0.0)
 
-    @property
-    def extra_state_attributes(self) -> dict:
+    def _build_attrs(self) -> dict:
         positions = self._positions
         if not positions:
             return {"open_positions": 0}
@@ -376,13 +444,14 @@ class BinancePnlSensor(CoordinatorEntity, SensorEntity):
             side = pos.get("positionSide", "BOTH")
             if side != "BOTH":
                 prefix = f"{prefix}_{side}"
-            attrs[f"{prefix}_amount"] = pos["positionAmt"]
-            attrs[f"{prefix}_entry_price"] = pos["entryPrice"]
-            attrs[f"{prefix}_mark_price"] = pos["markPrice"]
-            attrs[f"{prefix}_pnl"] = pos["unRealizedProfit"]
-            attrs[f"{prefix}_leverage"] = pos["leverage"]
-            attrs[f"{prefix}_margin_type"] = pos["marginType"]
-            attrs[f"{prefix}_liquidation_price"] = pos["liquidationPrice"]
+            amount, entry, mark, pnl, leverage, margin, liq = _PNL_FIELDS(pos)
+            attrs[f"{prefix}_amount"] = amount
+            attrs[f"{prefix}_entry_price"] = entry
+            attrs[f"{prefix}_mark_price"] = mark
+            attrs[f"{prefix}_pnl"] = pnl
+            attrs[f"{prefix}_leverage"] = leverage
+            attrs[f"{prefix}_margin_type"] = margin
+            attrs[f"{prefix}_liquidation_price"] = liq
         return attrs
 
     @property
@@ -1,13 +1,13 @@
 """WebSocket manager for real-time Binance price streams."""
 
 import asyncio
-import json
 import logging
-from typing import Any
+from dataclasses import dataclass
 
 import aiohttp
 
 from .const import (
+    BTCUSDT_PRICE,
     FUTURES_DATA,
     FUTURES_WS_URL,
     SPOT_DATA,
@@ -16,20 +16,49 @@ from .const import (
     WS_RECONNECT_DELAY,
 )
 
+try:
+    # HA core ships orjson; frame parsing is the hot path here.
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 _LOGGER = logging.getLogger(__name__)
 
 
-def _normalize_ws_ticker(ws_data: dict) -> dict[str, Any]:
-    """Convert WebSocket 24hrTicker fields to REST-compatible format."""
-    return {
-        "symbol": ws_data.get("s", ""),
-        "lastPrice": ws_data.get("c", "0"),
-        "priceChangePercent": ws_data.get("P", "0"),
-        "highPrice": ws_data.get("h", "0"),
-        "lowPrice": ws_data.get("l", "0"),
-        "volume": ws_data.get("v", "0"),
-        "quoteVolume": ws_data.get("q", "0"),
-    }
+@dataclass(slots=True)
+class Ticker:
+    """One symbol's 24hr ticker snapshot.
+
+    Fixed-slot records are smaller and cheaper to allocate than the
+    per-frame dicts they replace, and the generated __eq__ keeps the
+    coordinator's unchanged-data comparisons working. Both the REST
+    and websocket ingestion paths produce this shape.
+    """
+
+    symbol: str
+    last_price: float
+    price_change_percent: float
+    high_price: float
+    low_price: float
+    volume: float
+    quote_volume: float
+
+
+def _normalize_ws_ticker(ws_data: dict) -> Ticker:
+    """Convert WebSocket 24hrTicker fields to the coordinator's format.
+
+    Numeric fields become floats here, matching the REST ingestion path,
+    so sensor reads never re-parse strings.
+    """
+    return Ticker(
+        symbol=ws_data.get("s", ""),
+        last_price=float(ws_data.get("c", 0)),
+        price_change_percent=float(ws_data.get("P", 0)),
+        high_price=float(ws_data.get("h", 0)),
+        low_price=float(ws_data.get("l", 0)),
+        volume=float(ws_data.get("v", 0)),
+        quote_volume=float(ws_data.get("q", 0)),
+    )
 
 
 def _build_stream_urls(pairs: list[str], base_url: str) -> list[str]:
@@ -37,12 +66,13 @@ def _build_stream_urls(pairs: list[str], base_url: str) -> list[str]:
     if not pairs:
         return []
 
-    urls = []
-    for i in range(0, len(pairs), WS_MAX_STREAMS_PER_CONNECTION):
-        chunk = pairs[i : i + WS_MAX_STREAMS_PER_CONNECTION]
-        streams = "/".join(f"{symbol.lower()}@ticker" for symbol in chunk)
-        urls.append(f"{base_url}?streams={streams}")
-    return urls
+    # Lowercase once, then slice the prepared list per connection.
+    streams = [f"{symbol.lower()}@ticker" for symbol in pairs]
+    step = WS_MAX_STREAMS_PER_CONNECTION
+    return [
+        f"{base_url}?streams={'/'.join(streams[i : i + step])}"
+        for i in range(0, len(streams), step)
+    ]
 
 
 class BinanceWebSocketManager:
@@ -54,6 +84,9 @@ class BinanceWebSocketManager:
         self._session = session
         self._tasks: list[asyncio.Task] = []
         self._running = False
+        # (spot, futures) pair sets currently subscribed; lets callers
+        # skip a full stop/start cycle when nothing changed.
+        self.subscription: tuple[frozenset[str], frozenset[str]] | None = None
 
     @property
     def is_running(self) -> bool:
@@ -67,6 +100,12 @@ class BinanceWebSocketManager:
             await self.stop()
 
         self._running = True
+        self.subscription = (frozenset(spot_pairs), frozenset(futures_pairs))
+
+        # BTCUSDT backs the wallet USD conversion; always stream it so the
+        # coordinator doesn't need a REST price poll every cycle.
+        if "BTCUSDT" not in spot_pairs:
+            spot_pairs = [*spot_pairs, "BTCUSDT"]
 
         spot_urls = _build_stream_urls(spot_pairs, SPOT_WS_URL)
         futures_urls = _build_stream_urls(futures_pairs, FUTURES_WS_URL)
@@ -95,6 +134,7 @@ class BinanceWebSocketManager:
     async def stop(self) -> None:
         """Stop all WebSocket connections."""
         self._running = False
+        self.subscription = None
         for task in self._tasks:
             task.cancel()
             try:
@@ -154,16 +194,15 @@ class BinanceWebSocketManager:
     def _handle_message(self, raw: str, data_key: str) -> None:
         """Parse a WebSocket message and update coordinator data."""
         try:
-            payload = json.loads(raw)
-        except (json.JSONDecodeError, TypeError):
+            payload = _json_loads(raw)
+        except (ValueError, TypeError):
             return
 
         ws_data = payload.get("data")
         if not ws_data or not isinstance(ws_data, dict):
             return
 
-        ticker = _normalize_ws_ticker(ws_data)
-        symbol = ticker.get("symbol")
+        symbol = ws_data.get("s")
         if not symbol:
             return
 
@@ -171,9 +210,18 @@ class BinanceWebSocketManager:
         if not coord_data or data_key not in coord_data:
             return
 
-        # Only update symbols we're tracking.
-        if symbol not in coord_data[data_key]:
+        # Reject untracked symbols before normalizing so discarded
+        # frames never allocate the ticker dict.
+        tracked = symbol in coord_data[data_key]
+        # The BTCUSDT reference price rides along on the spot stream even
+        # when the pair itself isn't configured.
+        is_reference = data_key == SPOT_DATA and symbol == "BTCUSDT"
+        if not tracked and not is_reference:
             return
 
-        coord_data[data_key][symbol] = ticker
-        self._coordinator.async_set_updated_data(coord_data)
+        if is_reference:
+            coord_data[BTCUSDT_PRICE] = float(ws_data.get("c", 0))
+        if tracked:
+            coord_data[data_key][symbol] = _normalize_ws_ticker(ws_data)
+
+        self._coordinator.notify_ws_update()